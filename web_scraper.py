@@ -1,14 +1,146 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import EncodingDetector
 import time
 import json
 import csv
 import os
+import shutil
+import codecs
+import hashlib
 import re
 import argparse
+import asyncio
+import threading
+import queue
+import soupsieve
+from functools import lru_cache
 from urllib.parse import urlparse, urljoin
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp opsiyonel; yoksa thread tabanlı yol kullanılır
+    aiohttp = None
+
+try:
+    import lxml.html
+    import lxml.etree
+    _DEFAULT_PARSER = 'lxml'
+except ImportError:  # lxml yoksa yerleşik parser'a geri dön
+    lxml = None
+    _DEFAULT_PARSER = 'html.parser'
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import orjson
+except ImportError:  # orjson yoksa standart json modülü kullanılır
+    orjson = None
+
+# Bağlantıları yeniden kullanmak için ortak oturum (keep-alive + bağlantı havuzu)
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                       max_retries=Retry(total=3, backoff_factor=0.5,
+                                         status_forcelist=[429, 502, 503, 504]))
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.headers['User-Agent'] = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+# Aynı alan adına aynı anda yapılabilecek en fazla istek sayısı
+_PER_HOST_LIMIT = 4
+_HOST_SEMAPHORES = {}
+_HOST_SEMAPHORES_LOCK = threading.Lock()
+
+def _host_semaphore(url):
+    """URL'nin alan adına ait semaforu döndür (gerekirse oluştur)"""
+    host = urlparse(url).netloc
+    with _HOST_SEMAPHORES_LOCK:
+        sem = _HOST_SEMAPHORES.get(host)
+        if sem is None:
+            sem = _HOST_SEMAPHORES[host] = threading.BoundedSemaphore(_PER_HOST_LIMIT)
+        return sem
+
+# Alan adı başına token bucket hız sınırlayıcı (saniyede _RATE istek, en fazla _BURST birikim)
+_RATE = 2.0
+_BURST = 2.0
+_BUCKETS = {}
+_BUCKETS_LOCK = threading.Lock()
+
+def _take_token(host):
+    """Alan adı için istek hakkı almayı dene; alınırsa 0, yoksa beklenecek süreyi döndür"""
+    with _BUCKETS_LOCK:
+        now = time.monotonic()
+        tokens, last = _BUCKETS.get(host, (_BURST, now))
+        tokens = min(_BURST, tokens + (now - last) * _RATE)
+        if tokens >= 1:
+            _BUCKETS[host] = (tokens - 1, now)
+            return 0
+        _BUCKETS[host] = (tokens, now)
+        return (1 - tokens) / _RATE
+
+def _acquire(host):
+    """Alan adı için bir istek hakkı alınana kadar bekle"""
+    while True:
+        wait = _take_token(host)
+        if not wait:
+            return
+        time.sleep(wait)
+
+async def _acquire_async(host):
+    """_acquire'ın event loop'u bloklamayan sürümü (aynı kovaları paylaşır)"""
+    while True:
+        wait = _take_token(host)
+        if not wait:
+            return
+        await asyncio.sleep(wait)
+
+# İndirilen resimlerin kaydedileceği klasör; ilk kullanımda bir kez oluşturulur
+_PICTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pictures')
+_PICTURES_DIR_READY = False
+_PICTURES_DIR_LOCK = threading.Lock()
+
+def _ensure_pictures_dir():
+    """pictures klasörünü gerekiyorsa oluştur ve yolunu döndür"""
+    global _PICTURES_DIR_READY
+    if not _PICTURES_DIR_READY:
+        with _PICTURES_DIR_LOCK:
+            if not _PICTURES_DIR_READY:
+                os.makedirs(_PICTURES_DIR, exist_ok=True)
+                _PICTURES_DIR_READY = True
+    return _PICTURES_DIR
+
+# Resim indirmeleri için tüm sayfalar arasında paylaşılan thread havuzu
+_IMAGE_EXECUTOR = ThreadPoolExecutor(max_workers=16)
+
+# Varsayılan seçiciler ve yalnızca bunların okuduğu etiketleri kuran süzgeç
+_DEFAULT_SELECTORS = {
+    'title': 'title',
+    'paragraphs': 'p',
+    'links': 'a'
+}
+_STRAINED_TAGS = frozenset(['title', 'p', 'a', 'img'])
+_STRAINER = SoupStrainer(list(_STRAINED_TAGS))
+
+@lru_cache(maxsize=256)
+def _compile_sel(selector):
+    """CSS seçiciyi derle ve önbellekte tut"""
+    return soupsieve.compile(selector)
+
+# Dosya adlarında izin verilmeyen karakterleri silen çeviri tablosu (ASCII için hızlı yol)
+_FILENAME_TABLE = str.maketrans('', '', ''.join(
+    chr(i) for i in range(128) if not (chr(i).isalnum() or chr(i) in '_-.')))
+# ASCII dışı adlar için Unicode farkındalıklı desen
+_FILENAME_RE = re.compile(r'[^\w\-_.]')
 
 def validate_url(url):
     """URL'nin geçerliliğini kontrol eden fonksiyon
@@ -18,23 +150,35 @@ def validate_url(url):
     Returns:
         bool: URL geçerli ise True, değilse False
     """
-    url_pattern = re.compile(
-        r'^https?://'  # http:// veya https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...veya ip
-        r'(?::\d+)?'  # opsiyonel port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    
     try:
-        result = bool(url_pattern.match(url))
-        if result:
-            parsed = urlparse(url)
-            return all([parsed.scheme, parsed.netloc])
-        return False
+        parsed = urlparse(url)
+        return parsed.scheme in ('http', 'https') and bool(parsed.hostname)
     except Exception:
         return False
 
+def _clean_urls(raw):
+    """Geçersiz URL'leri ele ve tekrarları sırayı koruyarak tek geçişte kaldır"""
+    return list(dict.fromkeys(url for url in raw if validate_url(url)))
+
+def _url_hash(url):
+    """URL'den kararlı, kısa bir özet üret"""
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]
+
+def _image_filename(url):
+    """Resim URL'sinden temizlenmiş dosya adı üret
+
+    Ad her zaman tam URL'nin özetini içerir; böylece farklı sitelerdeki ya da
+    dizinlerdeki aynı adlı resimler (örn: logo.png) birbirinin yerine geçmez
+    ve diskte bulunan dosya gerçekten aynı resim demektir.
+    """
+    filename = os.path.basename(urlparse(url).path)
+    if filename.isascii():
+        filename = filename.translate(_FILENAME_TABLE)
+    else:
+        filename = _FILENAME_RE.sub('', filename)
+    stem, ext = os.path.splitext(filename)
+    return f'{stem[:100] or "image"}_{_url_hash(url)}{ext[:10] or ".jpg"}'
+
 def download_image(url, save_dir):
     """Belirtilen URL'den resmi indir ve kaydet
     
@@ -49,129 +193,354 @@ def download_image(url, save_dir):
         if not url.startswith(('http://', 'https://')):
             return None
             
-        # Resim dosyasını indir
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-        
         # Dosya adını URL'den al ve temizle
-        filename = os.path.basename(urlparse(url).path)
-        filename = re.sub(r'[^\w\-_.]', '', filename)
-        if not filename:
-            filename = f'image_{int(time.time())}.jpg'
-            
-        # Dosya yolunu oluştur ve kaydet
+        filename = _image_filename(url)
+        
+        # Dosya zaten varsa tekrar indirme (yalnızca tamamlanmış indirmeler bu adla bulunur)
         filepath = os.path.join(save_dir, filename)
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+        if os.path.exists(filepath):
+            return filepath
+            
+        # Resim dosyasını geçici .part dosyasına 1 MiB'lık bloklarla indir,
+        # ancak başarıyla bitince asıl adına taşı
+        part_path = f'{filepath}.{threading.get_ident()}.part'
+        try:
+            with _SESSION.get(url, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(part_path, 'wb', buffering=0) as f:
+                    shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+            os.replace(part_path, filepath)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
         return filepath
     except Exception as e:
         print(f'Resim indirme hatası ({url}): {str(e)}')
         return None
 
-def web_scraper(url, selectors=None, proxy=None, download_images=False):
+def _header_charset(content_type):
+    """Content-Type başlığında açıkça belirtilmiş charset'i döndür
+
+    requests'in text/* için varsaydığı ISO-8859-1 burada kullanılmaz;
+    charset yoksa ya da Python'un tanımadığı bir değerse (örn: utf8mb4)
+    kodlamayı parser kendisi bulur.
+    """
+    if not content_type:
+        return None
+    for param in content_type.split(';')[1:]:
+        key, _, value = param.partition('=')
+        if key.strip().lower() == 'charset':
+            value = value.strip().strip('"\'')
+            if not value:
+                return None
+            # Yalnızca doğrula; Python'un kodek adı (örn: euc_jp) libxml2'ye
+            # yabancı olduğundan başlıktaki özgün değer aynen iletilir
+            try:
+                codecs.lookup(value)
+            except LookupError:
+                return None
+            return value
+    return None
+
+def _extract_soup(html, selectors, parser, encoding=None):
+    """BeautifulSoup ile başlık, paragraf, link ve resim kaynaklarını çıkar"""
+    # Seçiciler yalnızca süzülen etiket adlarından oluşuyorsa ağacın kalanını kurma
+    if _STRAINED_TAGS.issuperset(selectors.values()):
+        soup = BeautifulSoup(html, parser, parse_only=_STRAINER, from_encoding=encoding)
+    else:
+        soup = BeautifulSoup(html, parser, from_encoding=encoding)
+    title = _compile_sel(selectors['title']).select_one(soup)
+    # NavigableString ağaca referans tutar; düz str'ye çevir ki ağaç serbest kalsın
+    title = str(title.string) if title and title.string is not None else None
+    result = (
+        title,
+        [p.text.strip() for p in _compile_sel(selectors['paragraphs']).iselect(soup, limit=5)],
+        [{'text': a.text.strip(), 'href': a.get('href')}
+         for a in _compile_sel(selectors['links']).iselect(soup, limit=10) if a.get('href')],
+        [img.get('src') for img in soup.find_all('img') if img.get('src')],
+    )
+    # Resimler indirilirken ağaç bellekte tutulmasın
+    soup.decompose()
+    return result
+
+def _sniff_encoding(html):
+    """Gövdenin tamamında istatistiksel tespit yapmadan ucuz kodlama tahmini
+
+    Sırasıyla BOM, belgenin başındaki <meta> charset bildirimi ve katı UTF-8
+    çözümü denenir; hiçbiri tutmazsa windows-1252 varsayılır.
+    """
+    for bom, name in ((codecs.BOM_UTF8, 'utf-8'),
+                      (codecs.BOM_UTF16_LE, 'utf-16-le'),
+                      (codecs.BOM_UTF16_BE, 'utf-16-be')):
+        if html.startswith(bom):
+            return name
+    declared = EncodingDetector.find_declared_encoding(html, is_html=True)
+    if declared:
+        try:
+            codecs.lookup(declared)
+            return declared
+        except LookupError:
+            pass
+    try:
+        html.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'windows-1252'
+
+def _lxml_parser(encoding):
+    """Verilen kodlama için lxml HTML parser'ı; libxml2 tanımıyorsa None"""
+    try:
+        return lxml.html.HTMLParser(encoding=encoding)
+    except LookupError:
+        return None
+
+def _extract_lxml_default(html, want_images, encoding=None):
+    """Varsayılan seçiciler için lxml ile tek geçişte veri çıkar
+
+    title/p/a için CSS derlemeye gerek yok; ağaç bir kez dolaşılır ve
+    (resim istenmiyorsa) tüm sınırlar dolunca erken çıkılır.
+    """
+    # Başlıkta charset yoksa libxml2 baytları Latin-1 sayar; kodlamayı önce belirle
+    parser = _lxml_parser(encoding) if encoding else None
+    if parser is None:
+        parser = _lxml_parser(_sniff_encoding(html))
+    try:
+        root = lxml.html.fromstring(html, parser=parser)
+    except lxml.etree.ParserError:  # boş belge
+        return None, [], [], []
+    title = None
+    title_seen = False
+    paragraphs, links, img_srcs = [], [], []
+    link_count = 0
+    for el in root.iter('title', 'p', 'a', 'img'):
+        tag = el.tag
+        if tag == 'title':
+            # Genel yol gibi yalnızca ilk <title> kullanılır (boş olsa bile);
+            # sonraki <svg><title> gibi öğeler başlık sayılmaz
+            if not title_seen:
+                title_seen = True
+                title = el.text
+        elif tag == 'p':
+            if len(paragraphs) < 5:
+                paragraphs.append(el.text_content().strip())
+        elif tag == 'a':
+            if link_count < 10:
+                link_count += 1
+                href = el.get('href')
+                if href:
+                    links.append({'text': el.text_content().strip(), 'href': href})
+        elif want_images:
+            src = el.get('src')
+            if src:
+                img_srcs.append(src)
+        if (not want_images and title_seen
+                and len(paragraphs) >= 5 and link_count >= 10):
+            break
+    return title, paragraphs, links, img_srcs
+
+def _extract_selectolax(html, selectors):
+    """selectolax ile başlık, paragraf, link ve resim kaynaklarını çıkar"""
+    tree = HTMLParser(html)
+    title = tree.css_first(selectors['title'])
+    return (
+        title.text() if title else None,
+        [p.text().strip() for p in tree.css(selectors['paragraphs'])[:5]],
+        [{'text': a.text().strip(), 'href': a.attributes.get('href')}
+         for a in tree.css(selectors['links'])[:10] if a.attributes.get('href')],
+        [img.attributes.get('src') for img in tree.css('img') if img.attributes.get('src')],
+    )
+
+def _parse_page(url, html, selectors=None, download_images=False, parser=_DEFAULT_PARSER,
+                encoding=None):
+    """İndirilen HTML içeriğinden veri çıkar
+
+    Args:
+        url (str): Sayfanın URL'si (göreceli linkleri çözmek için)
+        html (bytes): Sayfanın ham HTML içeriği (kodlamayı parser belirler)
+        selectors (dict): HTML elementlerini seçmek için kullanılacak CSS seçiciler
+        download_images (bool): Sayfadaki resimler indirilsin mi
+        parser (str): 'lxml', 'html.parser' veya 'selectolax'
+        encoding (str): Content-Type başlığındaki charset (yoksa parser tespit eder)
+    Returns:
+        dict: Çekilen veriler
+    """
+    # Varsayılan veya özel seçicilerle veri çekme
+    if not selectors:
+        selectors = _DEFAULT_SELECTORS
+    
+    # HTML içeriğini parse et
+    if selectors is _DEFAULT_SELECTORS and parser == 'lxml' and lxml is not None:
+        title, paragraphs, links, img_srcs = _extract_lxml_default(html, download_images, encoding)
+    elif parser == 'selectolax' and HTMLParser is not None:
+        title, paragraphs, links, img_srcs = _extract_selectolax(html, selectors)
+    else:
+        if parser == 'selectolax':
+            parser = _DEFAULT_PARSER
+        title, paragraphs, links, img_srcs = _extract_soup(html, selectors, parser, encoding)
+    
+    data = {
+        'url': url,
+        'timestamp': datetime.now().isoformat(),
+        'title': title if title else 'Başlık bulunamadı',
+        'paragraphs': paragraphs,
+        'links': links
+    }
+    
+    # Resim indirme özelliği aktifse
+    if download_images:
+        # pictures klasörünü oluştur
+        pictures_dir = _ensure_pictures_dir()
+        
+        # Göreceli URL'leri tam URL'ye çevir ve tekrarları ayıkla; dosya adı URL
+        # özetini içerdiğinden farklı URL'ler aynı dosyaya yazmaz
+        img_urls = list(dict.fromkeys(urljoin(url, src) for src in img_srcs))
+        
+        # Resimleri paralel indir
+        saved_paths = _IMAGE_EXECUTOR.map(
+            lambda img_url: download_image(img_url, pictures_dir), img_urls)
+        data['images'] = [{'original_url': img_url, 'saved_path': saved_path}
+                          for img_url, saved_path in zip(img_urls, saved_paths) if saved_path]
+    
+    return data
+
+def web_scraper(url, selectors=None, proxy=None, download_images=False, parser=_DEFAULT_PARSER):
     """Belirtilen URL'den veri çeken gelişmiş fonksiyon
     
     Args:
         url (str): Veri çekilecek URL
         selectors (dict): HTML elementlerini seçmek için kullanılacak CSS seçiciler
         proxy (dict): Proxy ayarları (örn: {'http': 'http://proxy.example.com:8080'})
+        parser (str): HTML parser ('lxml', 'html.parser' veya 'selectolax')
     """
     try:
-        # Rate limiting - aşırı istekleri önlemek için
-        time.sleep(1)
-        
-        # Web sitesine GET isteği gönder
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        # Web sitesine GET isteği gönder (User-Agent oturumda tanımlı)
+        # Rate limiting - aşırı istekleri önlemek için alan adı bazında sınırla
+        _acquire(urlparse(url).netloc)
         
-        # Proxy kullanımı
-        if proxy:
-            response = requests.get(url, headers=headers, proxies=proxy)
-        else:
-            response = requests.get(url, headers=headers)
+        # Proxy kullanımı; aynı alan adını boğmamak için eşzamanlı istekleri sınırla
+        with _host_semaphore(url):
+            if proxy:
+                response = _SESSION.get(url, proxies=proxy)
+            else:
+                response = _SESSION.get(url)
         response.raise_for_status()
         
-        # HTML içeriğini parse et
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Varsayılan veya özel seçicilerle veri çekme
-        if not selectors:
-            selectors = {
-                'title': 'title',
-                'paragraphs': 'p',
-                'links': 'a'
-            }
-        
-        data = {
-            'url': url,
-            'timestamp': datetime.now().isoformat(),
-            'title': soup.select_one(selectors['title']).string if soup.select_one(selectors['title']) else 'Başlık bulunamadı',
-            'paragraphs': [p.text.strip() for p in soup.select(selectors['paragraphs'])[:5]],
-            'links': [{'text': a.text.strip(), 'href': a.get('href')} 
-                      for a in soup.select(selectors['links'])[:10] if a.get('href')]
-        }
-        
-        # Resim indirme özelliği aktifse
-        if download_images:
-            # pictures klasörünü oluştur
-            pictures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pictures')
-            os.makedirs(pictures_dir, exist_ok=True)
-            
-            # Resimleri bul ve indir
-            images = []
-            for img in soup.find_all('img'):
-                img_url = img.get('src')
-                if img_url:
-                    # Göreceli URL'leri tam URL'ye çevir
-                    img_url = urljoin(url, img_url)
-                    # Resmi indir
-                    saved_path = download_image(img_url, pictures_dir)
-                    if saved_path:
-                        images.append({
-                            'original_url': img_url,
-                            'saved_path': saved_path
-                        })
-            
-            data['images'] = images
-        
-        return data
+        # Gövde bayt olarak verilir; response.text'in ikinci kopyası ve kodlama tahmini yapılmaz
+        encoding = _header_charset(response.headers.get('Content-Type'))
+        return _parse_page(url, response.content, selectors, download_images, parser, encoding)
         
     except requests.exceptions.RequestException as e:
         return {'error': f'Bağlantı hatası: {str(e)}'}
     except Exception as e:
         return {'error': f'Beklenmeyen hata: {str(e)}'}
 
+def _dumps(obj, indent=False):
+    """Veriyi UTF-8 JSON baytlarına çevir (varsa orjson ile)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+class JsonlWriter:
+    """Kayıtları tek bir yazıcı thread ile satır satır JSONL dosyasına yazar
+
+    Worker thread'ler write() ile kuyruğa kayıt ekler; dosyaya yalnızca
+    yazıcı thread dokunur. Yazılamayan kayıtlar atlanır ve ilk hata
+    close() çağrısında yeniden fırlatılır. Örnek:
+
+        with JsonlWriter('sonuclar.jsonl') as writer:
+            scrape_multiple_urls(urls, on_result=writer.write)
+    """
+
+    _STOP = object()
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self.error = None
+        self._queue = queue.Queue()
+        self._file = open(path, 'wb')
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            record = self._queue.get()
+            if record is self._STOP:
+                break
+            try:
+                self._file.write(_dumps(record) + b'\n')
+                self.count += 1
+            except Exception as e:
+                # Thread ölmesin; kuyruğu boşaltmaya devam et, hatayı close()'a sakla
+                print(f'JSONL yazma hatası: {str(e)}')
+                if self.error is None:
+                    self.error = e
+
+    def write(self, record):
+        self._queue.put(record)
+
+    def close(self):
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._file.close()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.close()
+        except Exception:
+            # Blok içinde zaten bir hata varsa onu gölgeleme
+            if exc_type is None:
+                raise
+
+_CSV_FIELDS = ['url', 'timestamp', 'title', 'paragraphs', 'links']
+
+def _csv_rows(data):
+    """CSV için düz satırları tek tek üret"""
+    for item in data:
+        yield {
+            'url': item['url'],
+            'timestamp': item['timestamp'],
+            'title': item['title'],
+            'paragraphs': '\n'.join(item['paragraphs']),
+            'links': '\n'.join(f"{link['text']} ({link['href']})" for link in item['links'])
+        }
+
 def save_data(data, filename='scraping_results', format='json'):
     """Çekilen veriyi belirtilen formatta kaydet
     
     Args:
         data: Kaydedilecek veri
         filename (str): Dosya adı (uzantısız)
-        format (str): Kayıt formatı ('json' veya 'csv')
+        format (str): Kayıt formatı ('json', 'jsonl' veya 'csv')
     """
     try:
         if format.lower() == 'json':
-            with open(f'{filename}.json', 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(f'{filename}.json', 'wb') as f:
+                f.write(_dumps(data, indent=True))
             print(f'\nVeriler {filename}.json dosyasına kaydedildi.')
         
+        elif format.lower() == 'jsonl':
+            with open(f'{filename}.jsonl', 'wb') as f:
+                for record in (data if isinstance(data, list) else [data]):
+                    f.write(_dumps(record))
+                    f.write(b'\n')
+            print(f'\nVeriler {filename}.jsonl dosyasına kaydedildi.')
+        
         elif format.lower() == 'csv':
-            # CSV için düz veri yapısı oluştur
-            flat_data = [{
-                'url': item['url'],
-                'timestamp': item['timestamp'],
-                'title': item['title'],
-                'paragraphs': '\n'.join(item['paragraphs']),
-                'links': '\n'.join([f"{link['text']} ({link['href']})" for link in item['links']])
-            } for item in data] if isinstance(data, list) else [data]
-            
             with open(f'{filename}.csv', 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=flat_data[0].keys())
+                writer = csv.DictWriter(f, fieldnames=_CSV_FIELDS)
                 writer.writeheader()
-                writer.writerows(flat_data)
+                writer.writerows(_csv_rows(data if isinstance(data, list) else [data]))
             print(f'\nVeriler {filename}.csv dosyasına kaydedildi.')
         
         else:
@@ -180,20 +549,75 @@ def save_data(data, filename='scraping_results', format='json'):
     except Exception as e:
         print(f'Dosya kaydetme hatası: {str(e)}')
 
-def scrape_multiple_urls(urls, selectors=None, proxy=None, download_images=False):
-    """Birden fazla URL'den veri çek"""
+def scrape_multiple_urls(urls, selectors=None, proxy=None, download_images=False, max_workers=None,
+                         on_result=None):
+    """Birden fazla URL'den veri çek
+
+    Sonuçlar tamamlanma sırasına göre işlenir; yavaş bir URL diğerlerini bekletmez.
+
+    Args:
+        max_workers (int): Thread sayısı (varsayılan: min(32, URL sayısı))
+        on_result (callable): Her başarılı sonuç için hemen çağrılır (örn. dosyaya yazmak için).
+            Verilirse sonuçlar bellekte biriktirilmez ve boş liste döner.
+    """
+    if max_workers is None:
+        max_workers = min(32, len(urls) or 1)
     results = []
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [executor.submit(web_scraper, url, selectors, proxy, download_images) for url in urls]
-        for future in futures:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(web_scraper, url, selectors, proxy, download_images): url for url in urls}
+        for future in as_completed(futures):
             try:
                 result = future.result()
-                if 'error' not in result:
+                if 'error' in result:
+                    continue
+                if on_result:
+                    on_result(result)
+                else:
                     results.append(result)
             except Exception as e:
-                print(f'URL işleme hatası: {str(e)}')
+                print(f'URL işleme hatası ({futures[future]}): {str(e)}')
     return results
 
+async def _fetch(sem, session, url, selectors=None, proxy=None, download_images=False):
+    """Tek bir URL'yi asenkron olarak çek ve parse et"""
+    try:
+        # Thread tabanlı yolla aynı alan adı bazlı hız sınırı
+        await _acquire_async(urlparse(url).netloc)
+        async with sem:
+            async with session.get(url, proxy=proxy.get('http') if proxy else None) as response:
+                response.raise_for_status()
+                html = await response.read()
+                encoding = _header_charset(response.headers.get('Content-Type'))
+        # CPU yoğun parse işlemi event loop'u bloklamasın
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, _parse_page, url, html, selectors, download_images, _DEFAULT_PARSER, encoding)
+    except aiohttp.ClientError as e:
+        return {'error': f'Bağlantı hatası: {str(e)}'}
+    except Exception as e:
+        return {'error': f'Beklenmeyen hata: {str(e)}'}
+
+async def scrape_multiple_urls_async(urls, selectors=None, proxy=None, download_images=False, limit=20):
+    """Birden fazla URL'den asyncio + aiohttp ile veri çek
+
+    Args:
+        urls (list): Veri çekilecek URL'ler
+        limit (int): Aynı anda yapılabilecek en fazla istek sayısı
+    """
+    if aiohttp is None:
+        raise RuntimeError('Asenkron mod için aiohttp kurulu olmalı (pip install aiohttp)')
+    sem = asyncio.Semaphore(limit)
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=8, keepalive_timeout=30)
+    headers = {'User-Agent': _SESSION.headers['User-Agent']}
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+        results = await asyncio.gather(
+            *[_fetch(sem, session, url, selectors, proxy, download_images) for url in urls])
+    return [result for result in results if 'error' not in result]
+
+def scrape_multiple_urls_aio(urls, selectors=None, proxy=None, download_images=False, limit=20):
+    """scrape_multiple_urls_async için senkron sarmalayıcı"""
+    return asyncio.run(scrape_multiple_urls_async(urls, selectors, proxy, download_images, limit))
+
 def print_banner():
     banner = r"""
  __      __          __          ____                                                           
@@ -238,7 +662,8 @@ def main():
             data = web_scraper(url)
             
         elif choice == '2':
-            urls = []
+            # Sıralı küme olarak dict: tekrar kontrolü O(1)
+            urls = {}
             print("\nURL'leri girin (bitirmek için boş bırakın):")
             while True:
                 url = input('URL: ')
@@ -253,9 +678,9 @@ def main():
                 if url in urls:
                     print('Bu URL zaten listeye eklenmiş!')
                     continue
-                urls.append(url)
+                urls[url] = None
                 print(f'URL eklendi. Toplam: {len(urls)}')
-            data = scrape_multiple_urls(urls)
+            data = scrape_multiple_urls(list(urls))
             
         elif choice == '3':
             while True:
@@ -311,13 +736,23 @@ def main():
             print(f'Paragraf sayısı: {len(data["paragraphs"])}')
             print(f'Link sayısı: {len(data["links"])}')
         
-        format_choice = input('\nKayıt formatı (json/csv): ').lower()
-        if format_choice in ['json', 'csv']:
+        format_choice = input('\nKayıt formatı (json/jsonl/csv): ').lower()
+        if format_choice in ['json', 'jsonl', 'csv']:
             save_data(data, format=format_choice)
         else:
             print('Geçersiz format! Varsayılan olarak JSON kullanılıyor...')
             save_data(data)
 
+def _positive_int(value):
+    """argparse için pozitif tam sayı doğrulayıcı"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'Geçersiz sayı: {value}')
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'Pozitif bir sayı olmalı: {value}')
+    return number
+
 def parse_arguments():
     parser = argparse.ArgumentParser(description='Gelişmiş Web Scraping Aracı')
     parser.add_argument('url', nargs='?', help='Veri çekilecek URL')
@@ -325,19 +760,63 @@ def parse_arguments():
     parser.add_argument('-p', '--picture', action='store_true', help='Resimleri indir')
     parser.add_argument('-s', '--selector', help='Özel CSS seçici (örn: title=h1,paragraphs=div.content p)')
     parser.add_argument('--proxy', help='Proxy URL (örn: http://proxy.example.com:8080)')
+    parser.add_argument('-f', '--format', choices=['json', 'jsonl', 'csv'], default='json',
+                        help='Kayıt formatı (jsonl çoklu URL sonuçlarını tamamlandıkça yazar)')
+    parser.add_argument('-w', '--workers', type=_positive_int,
+                        help='Çoklu URL için thread sayısı (--async ile eşzamanlı istek sınırı)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Çoklu URL için asyncio + aiohttp kullan')
     return parser.parse_args()
 
+# Seçici argümanındaki "anahtar=" başlangıcı (örn: "title=", " paragraphs = ")
+_SEL_KEY_RE = re.compile(r'\s*(\w+)\s*=')
+# Seçici olamayacak anahtar adları; 'title' gerçek bir HTML etiketi olduğundan
+# seçici listesinin devamı olarak geçerlidir (örn: paragraphs=p, title)
+_BARE_KEY_NAMES = frozenset(['paragraphs', 'links'])
+
 def process_selector_arg(selector_str):
+    """'title=h1,paragraphs=div.content p' biçimindeki seçici argümanını çöz
+
+    Metin tek geçişte taranır; köşeli parantez, parantez ve tırnak içindeki
+    virgüller bölmez (örn: div[data-x="a,b"]). Anahtar içermeyen bir parça
+    önceki seçicinin devamı sayılır (örn: title=h1, h2); ancak '=' olmadan
+    yazılmış bir seçici anahtarı ya da kapanmamış tırnak/parantez hatadır.
+
+    Returns:
+        dict: Seçiciler veya çözülemezse None
+    """
     if not selector_str:
         return None
-    try:
-        selectors = {}
-        for item in selector_str.split(','):
-            key, value = item.split('=')
-            selectors[key.strip()] = value.strip()
-        return selectors
-    except:
+    selectors = {}
+    key = None
+    depth = 0
+    quote = None
+    start = 0
+    for i, ch in enumerate(selector_str + ','):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in '"\'':
+            quote = ch
+        elif ch in '[(':
+            depth += 1
+        elif ch in '])':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            part = selector_str[start:i]
+            start = i + 1
+            match = _SEL_KEY_RE.match(part)
+            if match:
+                key = match.group(1)
+                selectors[key] = part[match.end():].strip()
+            elif key is not None and part.strip() not in _BARE_KEY_NAMES:
+                selectors[key] += ',' + part
+            elif part.strip():
+                return None
+    if quote or depth:
         return None
+    selectors = {k: v.strip() for k, v in selectors.items() if v.strip()}
+    return selectors or None
 
 if __name__ == '__main__':
     args = parse_arguments()
@@ -351,9 +830,28 @@ if __name__ == '__main__':
         
         # Tek URL veya çoklu URL işleme
         if args.urls:
-            urls = [url for url in args.urls if validate_url(url)]
-            if urls:
-                data = scrape_multiple_urls(urls, selectors, proxy, args.picture)
+            urls = _clean_urls(args.urls)
+            if urls and args.use_async:
+                try:
+                    data = scrape_multiple_urls_aio(urls, selectors, proxy, args.picture,
+                                                    limit=args.workers or 20)
+                except RuntimeError as e:
+                    print(f'Hata: {str(e)}')
+                    exit(1)
+            elif urls and args.format == 'jsonl':
+                # Sonuçları tamamlandıkça tek bir yazıcı thread ile dosyaya aktar
+                try:
+                    with JsonlWriter('scraping_results.jsonl') as writer:
+                        scrape_multiple_urls(urls, selectors, proxy, args.picture, args.workers,
+                                             on_result=writer.write)
+                except Exception as e:
+                    print(f'Dosya kaydetme hatası: {str(e)}')
+                    exit(1)
+                print(f"\n{writer.count} URL'den veri çekildi.")
+                print('\nVeriler scraping_results.jsonl dosyasına kaydedildi.')
+                exit(0)
+            elif urls:
+                data = scrape_multiple_urls(urls, selectors, proxy, args.picture, args.workers)
             else:
                 print('Geçerli URL bulunamadı!')
                 exit(1)
@@ -378,6 +876,6 @@ if __name__ == '__main__':
             if args.picture and 'images' in data:
                 print(f'İndirilen resim sayısı: {len(data["images"])}')
         
-        save_data(data)
+        save_data(data, format=args.format)
     else:
         main()